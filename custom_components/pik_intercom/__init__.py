@@ -29,16 +29,12 @@ from custom_components.pik_intercom.const import *
 from custom_components.pik_intercom.entity import (
     BasePikUpdateCoordinator,
     PikIcmIntercomUpdateCoordinator,
-    PikIotIntercomsUpdateCoordinator,
-    PikIotCamerasUpdateCoordinator,
-    PikIotMetersUpdateCoordinator,
+    PikIotUpdateCoordinator,
     PikLastCallSessionUpdateCoordinator,
     PikIcmPropertyUpdateCoordinator,
 )
 from custom_components.pik_intercom.helpers import (
     phone_validator,
-    patch_haffmpeg,
-    ConfigEntryLoggerAdapter,
     AnyLogger,
     get_logger,
     async_get_authenticated_api,
@@ -58,7 +54,7 @@ PLATFORMS: Final = (
 _BASE_CONFIG_ENTRY_SCHEMA: Final = vol.Schema(
     {
         vol.Required(CONF_USERNAME): vol.All(
-            cv.string, vol.Any(phone_validator, vol.Email)
+            cv.string, vol.Any(phone_validator, vol.Email())
         ),
         vol.Required(CONF_PASSWORD): cv.string,
         # Additional parameters
@@ -100,10 +96,6 @@ CONFIG_SCHEMA: Final = vol.Schema(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the PIK Intercom component."""
-    # Patch HAffmpeg
-    # @TODO: check if still required
-    patch_haffmpeg()
-
     # Check if YAML configuration is present
     if not (domain_config := config.get(DOMAIN)):
         return True
@@ -282,16 +274,11 @@ async def async_init_iot_coordinators(
         logger.debug("Not setting up IoT device updates")
 
     return [
-        coordinator_cls(
+        PikIotUpdateCoordinator(
             hass,
             api_object=api_object,
             update_interval=interval,
         )
-        for coordinator_cls in (
-            PikIotCamerasUpdateCoordinator,
-            PikIotMetersUpdateCoordinator,
-            PikIotIntercomsUpdateCoordinator,
-        )
     ]
 
 
@@ -318,8 +305,12 @@ async def async_init_lcs_coordinator(
         interval = None
         logger.debug("Not setting up last call session updates")
 
+    # Call sessions are updated in-place, so they can not be compared
     return PikLastCallSessionUpdateCoordinator(
-        hass, api_object=api_object, update_interval=interval
+        hass,
+        api_object=api_object,
+        update_interval=interval,
+        always_update=True,
     )
 
 
@@ -352,6 +343,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     )
 
+    # Shared in-flight fetches must not outlive the entry
+    for coordinator in coordinators:
+        entry.async_on_unload(coordinator.async_cancel_update)
+
     # Perform initial update tasks
     done, pending = await asyncio.wait(
         [
@@ -508,6 +503,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Remove coordinator
         hass.data.get(DOMAIN, {}).pop(entry.entry_id)
 
+        # Stop snapshot ffmpeg processes, cameras that remain loaded
+        # will start them again on demand
+        snapshotters = hass.data.get(DATA_SNAPSHOTTERS, {})
+        for snapshotter in tuple(snapshotters.values()):
+            snapshotter.async_stop()
+
         # Clear authentication updater
         if auth_updater := hass.data.get(DATA_REAUTHENTICATORS, {}).pop(
             entry.entry_id, None
@@ -6,9 +6,9 @@ __all__ = (
     "PikIntercomIotRelayUnlockerButton",
 )
 
-import asyncio
 import logging
 from abc import ABC
+from typing import Final
 
 from homeassistant.components.button import (
     ButtonEntity,
@@ -22,7 +22,7 @@ from custom_components.pik_intercom.const import DOMAIN
 from custom_components.pik_intercom.entity import (
     BasePikIcmIntercomEntity,
     BasePikIotRelayEntity,
-    PikIotIntercomsUpdateCoordinator,
+    PikIotUpdateCoordinator,
     PikIcmIntercomUpdateCoordinator,
     BasePikEntity,
     BasePikLastCallSessionEntity,
@@ -48,15 +48,10 @@ async def async_setup_entry(
 
     for coordinator in hass.data[DOMAIN][entry.entry_id]:
         # Add update listeners to meter entity
-        if isinstance(coordinator, PikIotIntercomsUpdateCoordinator):
-            objects_dict = coordinator.api_object.iot_relays
-            entity_cls = PikIntercomIotRelayUnlockerButton
-        elif isinstance(
-            coordinator,
-            (PikIcmIntercomUpdateCoordinator, PikIcmPropertyUpdateCoordinator),
-        ):
-            objects_dict = coordinator.api_object.icm_intercoms
-            entity_cls = PikIcmIntercomUnlockerButton
+        if (
+            setup_args := _COORDINATOR_ENTITIES.get(type(coordinator))
+        ) is not None:
+            container_name, entity_cls = setup_args
         else:
             if isinstance(coordinator, PikLastCallSessionUpdateCoordinator):
                 async_add_entities(
@@ -72,7 +67,7 @@ async def async_setup_entry(
         async_add_entities_with_listener(
             coordinator=coordinator,
             async_add_entities=async_add_entities,
-            containers=objects_dict,
+            container_names=container_name,
             entity_classes=entity_cls,
             logger=logger,
         )
@@ -93,18 +88,9 @@ class _BaseUnlockerButton(BasePikEntity, ButtonEntity, ABC):
         has_entity_name=True,
     )
 
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        ButtonEntity.__init__(self)
-
-    def press(self) -> None:
-        return asyncio.run_coroutine_threadsafe(
-            self.async_press(),
-            self.hass.loop,
-        ).result()
-
     async def async_press(self) -> None:
-        self.logger.debug(f"Will unlock {self._internal_object}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Will unlock {self._internal_object}")
         await self._internal_object.unlock()
 
 
@@ -134,3 +120,20 @@ class PikCallSessionUnlockerButton(
             if hasattr(call_session, "target_relay_ids")
             else None
         )
+
+
+# Container and entity class to set up per coordinator type
+_COORDINATOR_ENTITIES: Final = {
+    PikIotUpdateCoordinator: (
+        "iot_relays",
+        PikIntercomIotRelayUnlockerButton,
+    ),
+    PikIcmIntercomUpdateCoordinator: (
+        "icm_intercoms",
+        PikIcmIntercomUnlockerButton,
+    ),
+    PikIcmPropertyUpdateCoordinator: (
+        "icm_intercoms",
+        PikIcmIntercomUnlockerButton,
+    ),
+}
@@ -8,8 +8,10 @@ __all__ = (
 
 import asyncio
 import logging
+import random
 from abc import ABC
 from typing import (
+    Any,
     Optional,
     Union,
     Final,
@@ -23,17 +25,18 @@ from homeassistant.components.camera import (
     StreamType,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback, Event
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from custom_components.pik_intercom.const import DOMAIN
+from custom_components.pik_intercom.const import DOMAIN, DATA_SNAPSHOTTERS
 from custom_components.pik_intercom.entity import (
     BasePikIcmIntercomEntity,
     BasePikIotIntercomEntity,
     BasePikIotRelayEntity,
-    PikIotIntercomsUpdateCoordinator,
-    PikIotCamerasUpdateCoordinator,
+    PikIotUpdateCoordinator,
     PikIcmIntercomUpdateCoordinator,
     BasePikIotCameraEntity,
     BasePikEntity,
@@ -48,11 +51,64 @@ from pik_intercom import (
     ObjectWithVideo,
     ObjectWithSnapshot,
     ObjectWithSIP,
+    VideoQualityTypes,
 )
 
 _LOGGER: Final = logging.getLogger(__name__)
 
-AnyCameraType = Union[ObjectWithVideo, ObjectWithSnapshot]
+SNAPSHOT_PHOTO_CACHE_TTL: Final = 2  # 2 seconds
+SNAPSHOT_STREAM_CACHE_TTL: Final = 1  # 1 second, matches ffmpeg frame rate
+SNAPSHOT_RETRY_BASE_DELAY: Final = 1  # 1 second
+SNAPSHOT_RETRY_MAX_DELAY: Final = 300  # 5 minutes
+STREAM_SOURCE_SETTLE_DELAY: Final = 60  # 1 minute
+SNAPSHOTTER_IDLE_TIMEOUT: Final = 60  # 1 minute
+SNAPSHOTTER_FRAME_TIMEOUT: Final = 8  # 8 seconds
+SNAPSHOTTER_MAX_BUFFER_SIZE: Final = 8 * 1024 * 1024  # 8 megabytes
+SNAPSHOTTER_MAX_CONCURRENT_STARTS: Final = 2
+
+# Bounds ffmpeg processes starting up (up to their first frame, including
+# RTSP negotiation) when many cameras request snapshots at once
+_SNAPSHOTTER_START_SEMAPHORE: Final = asyncio.Semaphore(
+    SNAPSHOTTER_MAX_CONCURRENT_STARTS
+)
+
+# Arguments surrounding the stream URL, resolved once at import time
+_SNAPSHOTTER_INPUT_ARGS: Final = (
+    "-rtsp_flags",
+    "prefer_tcp",
+    # Stalled streams are detected by frame age instead of an I/O timeout,
+    # as `-timeout` puts RTSP input into listen mode on older ffmpeg builds
+    "-i",
+)
+_SNAPSHOTTER_OUTPUT_ARGS: Final = (
+    "-f",
+    "image2pipe",
+    "-vcodec",
+    "mjpeg",
+    "-q:v",
+    "5",
+    "-r",
+    "1",
+    "-",
+)
+
+_INTERCOM_CAMERA_DESCRIPTION: Final = CameraEntityDescription(
+    key="camera",
+    icon="mdi:doorbell-video",
+    name="Intercom",
+    translation_key="intercom",
+    has_entity_name=True,
+)
+_DISCRETE_CAMERA_DESCRIPTION: Final = CameraEntityDescription(
+    key="camera",
+    icon="mdi:cctv",
+    name="Camera",
+    translation_key="camera",
+    has_entity_name=True,
+)
+
+_JPEG_START: Final = b"\xff\xd8"
+_JPEG_END: Final = b"\xff\xd9"
 
 
 def check_has_camera(x: Union[ObjectWithVideo, ObjectWithSnapshot]) -> bool:
@@ -69,35 +125,201 @@ async def async_setup_entry(
 
     for coordinator in hass.data[DOMAIN][entry.entry_id]:
         # Add update listeners to meter entity
-        if isinstance(
-            coordinator,
-            (PikIcmIntercomUpdateCoordinator, PikIcmPropertyUpdateCoordinator),
+        for container_names, entity_classes in _COORDINATOR_ENTITIES.get(
+            type(coordinator), ()
         ):
-            containers = coordinator.api_object.icm_intercoms
-            entity_classes = PikIcmIntercomCamera
-        elif isinstance(coordinator, PikIotIntercomsUpdateCoordinator):
-            containers = (
-                coordinator.api_object.iot_intercoms,
-                coordinator.api_object.iot_relays,
+            async_add_entities_with_listener(
+                coordinator=coordinator,
+                async_add_entities=async_add_entities,
+                container_names=container_names,
+                entity_classes=entity_classes,
+                item_checker=check_has_camera,
+                logger=logger,
             )
-            entity_classes = (PikIotIntercomCamera, PikIotRelayCamera)
-        elif isinstance(coordinator, PikIotCamerasUpdateCoordinator):
-            containers = coordinator.api_object.iot_cameras
-            entity_classes = PikIotIntercomCamera
 
-        else:
-            continue
-
-        async_add_entities_with_listener(
-            coordinator=coordinator,
-            async_add_entities=async_add_entities,
-            containers=containers,
-            entity_classes=entity_classes,
-            item_checker=check_has_camera,
-            logger=logger,
+    return True
+
+
+class _KeepaliveSnapshotter:
+    """Long-lived ffmpeg process keeping the latest frame of an RTSP stream.
+
+    Spawning ffmpeg and negotiating RTSP for every snapshot is expensive,
+    therefore the process is kept running while snapshots are requested,
+    and is stopped after being idle for `SNAPSHOTTER_IDLE_TIMEOUT`.
+    """
+
+    def __init__(self, hass: HomeAssistant, stream_url: str) -> None:
+        self.hass = hass
+        self.stream_url = stream_url
+        self.latest: Optional[bytes] = None
+        self._latest_at: float = 0.0
+        self._frame_event = asyncio.Event()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether ffmpeg reader is currently active."""
+        return self._reader_task is not None
+
+    async def async_get_image(self) -> Optional[bytes]:
+        """Return the latest frame, starting ffmpeg when required."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+        self._idle_handle = self.hass.loop.call_later(
+            SNAPSHOTTER_IDLE_TIMEOUT, self.async_stop
         )
 
-    return True
+        # Hung ffmpeg process would otherwise keep serving the same frame
+        if (
+            self.latest is not None
+            and self.hass.loop.time() - self._latest_at
+            > SNAPSHOTTER_FRAME_TIMEOUT
+        ):
+            _LOGGER.debug("Restarting ffmpeg snapshotter with stale frame")
+            self._stop_reader()
+
+        if self._reader_task is None:
+            self._frame_event.clear()
+            self._reader_task = self.hass.async_create_background_task(
+                self._async_read_frames(), f"{DOMAIN} snapshotter"
+            )
+
+        if self.latest is None:
+            try:
+                await asyncio.wait_for(
+                    self._frame_event.wait(), SNAPSHOTTER_FRAME_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.debug("Timed out waiting for frame from ffmpeg")
+
+        return self.latest
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop ffmpeg process and remove snapshotter from the pool."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        self._stop_reader()
+
+        snapshotters = self.hass.data.get(DATA_SNAPSHOTTERS, {})
+        if snapshotters.get(self.stream_url) is self:
+            del snapshotters[self.stream_url]
+
+    async def _async_read_frames(self) -> None:
+        """Run ffmpeg and keep the last complete JPEG frame it outputs."""
+        # Start slot is held until the first frame arrives or ffmpeg exits
+        await _SNAPSHOTTER_START_SEMAPHORE.acquire()
+        starting = True
+        spawn = asyncio.ensure_future(
+            asyncio.create_subprocess_exec(
+                self.hass.data[ffmpeg.DATA_FFMPEG].binary,
+                *_SNAPSHOTTER_INPUT_ARGS,
+                self.stream_url,
+                *_SNAPSHOTTER_OUTPUT_ARGS,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        )
+        try:
+            # Spawning is shielded, so a process started after cancellation
+            # can still be killed once it becomes available
+            process = await asyncio.shield(spawn)
+        except asyncio.CancelledError:
+            _SNAPSHOTTER_START_SEMAPHORE.release()
+            spawn.add_done_callback(_kill_spawned_process)
+            raise
+        except OSError as exc:
+            _SNAPSHOTTER_START_SEMAPHORE.release()
+            _LOGGER.error("Could not start ffmpeg: %s", exc)
+            self._reset()
+            return
+        except BaseException:
+            _SNAPSHOTTER_START_SEMAPHORE.release()
+            raise
+
+        _LOGGER.debug("Started ffmpeg snapshotter (PID %s)", process.pid)
+        buffer = bytearray()
+        try:
+            while chunk := await process.stdout.read(65536):
+                buffer += chunk
+                if (end := buffer.rfind(_JPEG_END)) == -1:
+                    if len(buffer) > SNAPSHOTTER_MAX_BUFFER_SIZE:
+                        buffer.clear()
+                    continue
+                if (start := buffer.rfind(_JPEG_START, 0, end)) != -1:
+                    self.latest = bytes(buffer[start : end + 2])
+                    self._latest_at = self.hass.loop.time()
+                    self._frame_event.set()
+                    if starting:
+                        starting = False
+                        _SNAPSHOTTER_START_SEMAPHORE.release()
+                del buffer[: end + 2]
+        finally:
+            if starting:
+                _SNAPSHOTTER_START_SEMAPHORE.release()
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            _LOGGER.debug("Stopped ffmpeg snapshotter (PID %s)", process.pid)
+            self._reset()
+
+    @callback
+    def _stop_reader(self) -> None:
+        """Cancel running reader, detaching it from the snapshotter."""
+        if (reader_task := self._reader_task) is not None:
+            self._reader_task = None
+            reader_task.cancel()
+        self.latest = None
+        # Release waiters, they will receive an empty frame
+        self._frame_event.set()
+
+    @callback
+    def _reset(self) -> None:
+        # Reader may have already been replaced after being stopped
+        if self._reader_task is not asyncio.current_task():
+            return
+        self._reader_task = None
+        self.latest = None
+        # Release waiters, they will receive an empty frame
+        self._frame_event.set()
+
+
+def _kill_spawned_process(spawn: asyncio.Future) -> None:
+    """Kill process whose spawn outlived the reader that requested it."""
+    if spawn.cancelled() or spawn.exception() is not None:
+        return
+    process = spawn.result()
+    if process.returncode is None:
+        process.kill()
+    # Reap the process in the background to avoid leaving a zombie
+    asyncio.ensure_future(process.wait())
+
+
+@callback
+def async_get_snapshotter(
+    hass: HomeAssistant, stream_url: str
+) -> _KeepaliveSnapshotter:
+    """Get snapshotter for stream URL, shared between camera entities."""
+    if (snapshotters := hass.data.get(DATA_SNAPSHOTTERS)) is None:
+        hass.data[DATA_SNAPSHOTTERS] = snapshotters = {}
+
+        @callback
+        def _async_stop_snapshotters(_: Event) -> None:
+            for snapshotter in tuple(snapshotters.values()):
+                snapshotter.async_stop()
+
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_stop_snapshotters
+        )
+
+    if (snapshotter := snapshotters.get(stream_url)) is None:
+        snapshotters[stream_url] = snapshotter = _KeepaliveSnapshotter(
+            hass, stream_url
+        )
+    return snapshotter
 
 
 class _BaseIntercomCamera(BasePikEntity, Camera, ABC):
@@ -107,54 +329,149 @@ class _BaseIntercomCamera(BasePikEntity, Camera, ABC):
     _attr_frontend_stream_type = StreamType.HLS
     _attr_motion_detection_enabled = False
 
-    entity_description = CameraEntityDescription(
-        key="camera",
-        icon="mdi:doorbell-video",
-        name="Intercom",
-        translation_key="intercom",
-        has_entity_name=True,
-    )
+    # Resolved once per update, as `stream_url` scans video sources
+    _stream_url: Optional[str] = None
+
+    # Changed stream URL awaiting confirmation before stream restart,
+    # and cancellation of its delayed application
+    _pending_stream_url: Optional[str] = None
+    _cancel_pending_stream_url: Optional[CALLBACK_TYPE] = None
+
+    # Last snapshots with their expiry times, and running snapshot
+    # requests, keyed by stream URL used as a fallback source
+    _snapshot_cache: dict[Optional[str], tuple[float, bytes]]
+    _snapshot_tasks: dict[Optional[str], asyncio.Task]
+
+    # Backoff state for failing photo URL snapshots
+    _photo_failures: int = 0
+    _photo_retry_at: float = 0
+
+    # Source values of the last built camera attributes
+    _camera_signature: Optional[tuple] = None
+    _camera_attributes: dict[str, Any]
+
+    entity_description = _INTERCOM_CAMERA_DESCRIPTION
+
+    def __init__(self, *args, device, **kwargs) -> None:
+        # Object type does not change during entity lifetime, and flags
+        # must be available before the first attribute update
+        self._has_video = isinstance(device, ObjectWithVideo)
+        self._has_snapshot = isinstance(device, ObjectWithSnapshot)
+        self._has_sip = isinstance(device, ObjectWithSIP)
+        self._has_face_detection = hasattr(device, "is_face_detection")
+        self._snapshot_cache = {}
+        self._snapshot_tasks = {}
 
-    def __init__(self, *args, **kwargs) -> None:
         Camera.__init__(self)
-        super().__init__(*args, **kwargs)
+        super().__init__(*args, device=device, **kwargs)
 
-        # self._ffmpeg = self.hass.data[ffmpeg.DATA_FFMPEG]
-        self._does_not_require_tcp_transport: Optional[bool] = None
+    async def async_will_remove_from_hass(self) -> None:
+        await super().async_will_remove_from_hass()
+        self._snapshot_cache.clear()
+        self._clear_pending_stream_url()
 
     def _update_attr(self) -> None:
         """Update attributes for Pik Intercom camera entity."""
         super()._update_attr()
 
         device = self._internal_object
-        if not (
-            extra_state_attributes := getattr(
-                self, "_attr_extra_state_attributes", None
+        extra_state_attributes = self._attr_extra_state_attributes
+
+        has_video = self._has_video
+        has_snapshot = self._has_snapshot
+        has_sip = self._has_sip
+        has_face_detection = self._has_face_detection
+
+        stream_source = device.stream_url if has_video else None
+        snapshot_url = device.snapshot_url if has_snapshot else None
+        sip_user = device.sip_user if has_sip else None
+        sip_password = device.sip_password if has_sip else None
+        face_detection = (
+            device.is_face_detection if has_face_detection else None
+        )
+        signature = (
+            stream_source,
+            snapshot_url,
+            sip_user,
+            sip_password,
+            face_detection,
+        )
+
+        # Rebuild camera attributes only when their sources change
+        if signature != self._camera_signature:
+            self._camera_signature = signature
+            self._camera_attributes = camera_attributes = {}
+
+            if has_video:
+                self._stream_url = stream_source
+                camera_attributes["stream_url"] = stream_source
+
+            if has_snapshot:
+                camera_attributes["snapshot_url"] = snapshot_url
+
+            if has_sip:
+                camera_attributes["sip_user"] = sip_user
+                camera_attributes["sip_password"] = sip_password
+
+            if has_face_detection:
+                camera_attributes["face_detection"] = face_detection
+
+        extra_state_attributes.update(self._camera_attributes)
+
+        if has_video:
+            self._sync_stream_source(stream_source)
+
+    @callback
+    def _sync_stream_source(self, stream_source: Optional[str]) -> None:
+        """Restart running stream once its new source URL is stable."""
+        if not (stream := self.stream) or stream_source == stream.source:
+            self._clear_pending_stream_url()
+            return
+
+        if not stream.available:
+            self._clear_pending_stream_url()
+            self._set_stream_source(stream_source)
+            return
+
+        # Available streams restart only after the new source URL stays
+        # unchanged for a while, so flapping URLs do not restart them.
+        # Coordinators skip unchanged updates, so this can not wait for
+        # a repeated update.
+        if stream_source == self._pending_stream_url:
+            return
+
+        self._clear_pending_stream_url()
+        self._pending_stream_url = stream_source
+        self._cancel_pending_stream_url = async_call_later(
+            self.hass,
+            STREAM_SOURCE_SETTLE_DELAY,
+            self._apply_pending_stream_url,
+        )
+
+    @callback
+    def _clear_pending_stream_url(self) -> None:
+        if (cancel := self._cancel_pending_stream_url) is not None:
+            self._cancel_pending_stream_url = None
+            cancel()
+        self._pending_stream_url = None
+
+    @callback
+    def _apply_pending_stream_url(self, _: Any) -> None:
+        stream_source = self._pending_stream_url
+        self._cancel_pending_stream_url = None
+        self._pending_stream_url = None
+        if (stream := self.stream) and stream_source != stream.source:
+            self._set_stream_source(stream_source)
+
+    @callback
+    def _set_stream_source(self, stream_source: Optional[str]) -> None:
+        stream = self.stream
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Изменение URL потока: {stream.source} ---> {stream_source}"
             )
-        ):
-            self._attr_extra_state_attributes = extra_state_attributes = {}
-
-        if isinstance(device, ObjectWithVideo):
-            extra_state_attributes[
-                "stream_url"
-            ] = stream_source = device.stream_url
-            if stream := self.stream:
-                if stream_source != stream.source:
-                    self.logger.debug(
-                        f"Изменение URL потока: {stream.source} ---> {stream_source}"
-                    )
-                    stream.source = stream_source
-                    setattr(stream, "_fast_restart_once", True)
-
-        if isinstance(device, ObjectWithSnapshot):
-            extra_state_attributes["snapshot_url"] = device.snapshot_url
-
-        if isinstance(device, ObjectWithSIP):
-            extra_state_attributes["sip_user"] = device.sip_user
-            extra_state_attributes["sip_password"] = device.sip_password
-
-        if hasattr(device, "is_face_detection"):
-            extra_state_attributes["face_detection"] = device.is_face_detection
+        stream.source = stream_source
+        setattr(stream, "_fast_restart_once", True)
 
     def turn_off(self) -> None:
         raise HomeAssistantError("Binary state not supported")
@@ -172,63 +489,146 @@ class _BaseIntercomCamera(BasePikEntity, Camera, ABC):
         self, width: Optional[int] = None, height: Optional[int] = None
     ) -> Optional[bytes]:
         """Return a still image response from the camera."""
+        stream_url = self._get_snapshot_stream_url(width, height)
+
+        if (snapshot_cache := self._snapshot_cache.get(stream_url)) and (
+            self.hass.loop.time() < snapshot_cache[0]
+        ):
+            return snapshot_cache[1]
+
+        # Concurrent requests share a single snapshot retrieval
+        if (snapshot_task := self._snapshot_tasks.get(stream_url)) is None:
+            snapshot_task = self.hass.async_create_task(
+                self._async_get_snapshot(stream_url)
+            )
+            self._snapshot_tasks[stream_url] = snapshot_task
+            snapshot_task.add_done_callback(
+                lambda _: self._snapshot_tasks.pop(stream_url, None)
+            )
+
+        # Shielded, so that cancelling one request does not affect others
+        return await asyncio.shield(snapshot_task)
+
+    def _get_snapshot_stream_url(
+        self, width: Optional[int], height: Optional[int]
+    ) -> Optional[str]:
+        """Return stream URL to fall back to for a snapshot of given size."""
+        return self._stream_url
+
+    @callback
+    def _async_cache_snapshot(
+        self, stream_url: Optional[str], snapshot_image: bytes, ttl: float
+    ) -> None:
+        self._snapshot_cache[stream_url] = (
+            self.hass.loop.time() + ttl,
+            snapshot_image,
+        )
+
+    async def _async_get_snapshot(
+        self, stream_url: Optional[str]
+    ) -> Optional[bytes]:
+        """Retrieve snapshot from the first available source."""
         internal_object = self._internal_object
-        log_prefix = f"[{self.entity_id}] "
+
+        # Bind photo URL once, it is not re-read further on
+        photo_url = (
+            internal_object.snapshot_url if self._has_snapshot else None
+        )
 
         # Attempt to retrieve snapshot image using photo URL
-        if isinstance(internal_object, ObjectWithSnapshot):
-            if photo_url := internal_object.snapshot_url:
-                try:
-                    # Send the request to snap a picture and return raw JPEG data
-                    if snapshot_image := await internal_object.get_snapshot():
-                        return snapshot_image
-                except PikIntercomException as error:
-                    _LOGGER.debug(
-                        log_prefix + f"Ошибка получения снимка: {error}"
-                    )
-
-        if isinstance(internal_object, ObjectWithVideo):
-            # Attempt to retrieve snapshot image using RTSP stream
-            if (stream_url := internal_object.stream_url) and (
-                snapshot_image := await ffmpeg.async_get_image(
-                    self.hass,
-                    stream_url,
-                    extra_cmd="-prefix_rtsp_flags prefer_tcp",
-                    width=width,
-                    height=height,
+        if photo_url and self.hass.loop.time() >= self._photo_retry_at:
+            try:
+                # Send the request to snap a picture and return raw JPEG data
+                snapshot_image = await internal_object.get_snapshot()
+            except PikIntercomException as error:
+                snapshot_image = None
+                _LOGGER.debug(
+                    "[%s] Ошибка получения снимка: %s", self.entity_id, error
+                )
+
+            if snapshot_image:
+                self._photo_failures = 0
+                self._async_cache_snapshot(
+                    stream_url, snapshot_image, SNAPSHOT_PHOTO_CACHE_TTL
                 )
-            ):
                 return snapshot_image
 
+            # Back off exponentially, with jitter, before the next attempt
+            self._photo_failures = failures = self._photo_failures + 1
+            retry_delay = min(
+                SNAPSHOT_RETRY_MAX_DELAY,
+                SNAPSHOT_RETRY_BASE_DELAY * 2 ** (failures - 1),
+            ) + random.uniform(0, SNAPSHOT_RETRY_BASE_DELAY)
+            self._photo_retry_at = self.hass.loop.time() + retry_delay
+
+        # Attempt to retrieve snapshot image using RTSP stream
+        if stream_url and (
+            snapshot_image := await self.async_get_snapshot_by_ffmpeg(
+                stream_url
+            )
+        ):
+            self._async_cache_snapshot(
+                stream_url, snapshot_image, SNAPSHOT_STREAM_CACHE_TTL
+            )
+            return snapshot_image
+
         # Warn about missing sources
-        _LOGGER.warning(log_prefix + "Отсутствует источник снимков")
+        _LOGGER.warning("[%s] Отсутствует источник снимков", self.entity_id)
         return None
 
-    def camera_image(
-        self, width: Optional[int] = None, height: Optional[int] = None
+    async def async_get_snapshot_by_ffmpeg(
+        self, stream_url: str
     ) -> Optional[bytes]:
-        return asyncio.run_coroutine_threadsafe(
-            self.async_camera_image(width, height),
-            self.hass.loop,
-        ).result()
+        """Return the latest frame of the RTSP stream."""
+        return await async_get_snapshotter(
+            self.hass, stream_url
+        ).async_get_image()
 
     async def stream_source(self) -> Optional[str]:
         """Return the RTSP stream source."""
-        if isinstance(self._internal_object, ObjectWithVideo):
-            return self._internal_object.stream_url
+        return self._stream_url
 
 
 class PikIcmIntercomCamera(_BaseIntercomCamera, BasePikIcmIntercomEntity):
     """Entity representation of a property device camera."""
 
+    _video_items: tuple[tuple[str, str], ...] = ()
+    _video_attributes: dict[str, str]
+    _low_quality_stream_url: Optional[str] = None
+
     def _update_attr(self) -> None:
         super()._update_attr()
-        device = self._internal_object
-        if intercom_streams := device.video:
-            state_attributes = self._attr_extra_state_attributes
-            for key in intercom_streams:
-                for value in intercom_streams.getall(key):
-                    state_attributes[f"stream_url_{key}"] = value
+        if intercom_streams := self._internal_object.video:
+            # Rebuild per-quality attributes only when video sources change
+            if (video_items := tuple(intercom_streams.items())) != (
+                self._video_items
+            ):
+                self._video_items = video_items
+                self._video_attributes = {
+                    f"stream_url_{key}": value for key, value in video_items
+                }
+                self._low_quality_stream_url = intercom_streams.get(
+                    VideoQualityTypes.LOW
+                )
+            self._attr_extra_state_attributes.update(self._video_attributes)
+        else:
+            self._video_items = ()
+            self._low_quality_stream_url = None
+
+    def _get_snapshot_stream_url(
+        self, width: Optional[int], height: Optional[int]
+    ) -> Optional[str]:
+        # Scaled down snapshots (e.g. dashboard tiles) use low quality stream,
+        # unless a full quality snapshotter is already running; its frames
+        # are downscaled by the camera component instead of starting another
+        # ffmpeg process for the same camera
+        if (width or height) and (stream_url := self._low_quality_stream_url):
+            snapshotters = self.hass.data.get(DATA_SNAPSHOTTERS, {})
+            if (
+                snapshotter := snapshotters.get(self._stream_url)
+            ) is None or not snapshotter.is_running:
+                return stream_url
+        return super()._get_snapshot_stream_url(width, height)
 
 
 class PikIntercomIotDiscreteCamera(
@@ -236,13 +636,7 @@ class PikIntercomIotDiscreteCamera(
 ):
     """Entity representation of a singleton camera."""
 
-    entity_description = CameraEntityDescription(
-        key="camera",
-        icon="mdi:cctv",
-        name="Camera",
-        translation_key="camera",
-        has_entity_name=True,
-    )
+    entity_description = _DISCRETE_CAMERA_DESCRIPTION
 
 
 class PikIotIntercomCamera(BasePikIotIntercomEntity, _BaseIntercomCamera):
@@ -262,7 +656,7 @@ class PikIotRelayCamera(BasePikIotRelayEntity, _BaseIntercomCamera):
 
     def _update_attr(self) -> None:
         super()._update_attr()
-        intercom = self._internal_object.intercom
+        intercom = self.related_iot_intercom
         self._attr_extra_state_attributes["intercom_id"] = (
             intercom.id if intercom else None
         )
@@ -271,3 +665,22 @@ class PikIotRelayCamera(BasePikIotRelayEntity, _BaseIntercomCamera):
             if intercom and intercom.webrtc_supported
             else StreamType.HLS
         )
+
+
+# Containers and entity classes to set up per coordinator type; separate
+# pairs keep separate entity registries (item identifiers may overlap)
+_COORDINATOR_ENTITIES: Final = {
+    PikIcmIntercomUpdateCoordinator: (
+        ("icm_intercoms", PikIcmIntercomCamera),
+    ),
+    PikIcmPropertyUpdateCoordinator: (
+        ("icm_intercoms", PikIcmIntercomCamera),
+    ),
+    PikIotUpdateCoordinator: (
+        (
+            ("iot_intercoms", "iot_relays"),
+            (PikIotIntercomCamera, PikIotRelayCamera),
+        ),
+        ("iot_cameras", PikIotIntercomCamera),
+    ),
+}
@@ -5,8 +5,6 @@ __all__ = (
 )
 
 import logging
-import re
-from binascii import b2a_hex
 from datetime import timedelta
 from os import urandom
 from typing import Any, Dict, Final, Optional, Mapping
@@ -57,6 +55,24 @@ from custom_components.pik_intercom.helpers import (
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+_PHONE_TITLE_FORMAT: Final = "+{} ({}) {}-{}-{}".format
+
+_EMAIL_VALIDATOR: Final = vol.Email()
+
+
+def _make_entry_title(username: str) -> str:
+    """Make config entry title from e-mail or normalized phone number."""
+    if "@" in username:
+        return username
+    return _PHONE_TITLE_FORMAT(
+        username[1],
+        username[2:5],
+        username[5:8],
+        username[8:10],
+        username[10:],
+    )
+
+
 _INTERVALS_WITH_DEFAULTS: Final = {
     CONF_INTERCOMS_UPDATE_INTERVAL: (
         DEFAULT_INTERCOMS_UPDATE_INTERVAL,
@@ -76,6 +92,17 @@ _INTERVALS_WITH_DEFAULTS: Final = {
     ),
 }
 
+_INTERVAL_KEYS: Final = tuple(_INTERVALS_WITH_DEFAULTS)
+
+_INTERVAL_MINIMUMS: Final = tuple(
+    (key, min_interval)
+    for key, (_, min_interval) in _INTERVALS_WITH_DEFAULTS.items()
+)
+
+_DEFAULT_INTERVAL_VALUES: Final = {
+    key: value for key, (value, _) in _INTERVALS_WITH_DEFAULTS.items()
+}
+
 SHOW_INIT_OPTIONS = {
     vol.Required(CONF_DEVICE_ID): cv.string,
     vol.Optional(
@@ -121,7 +148,7 @@ class PikIntercomConfigFlow(ConfigFlow, domain=DOMAIN):
         if entry:
             self.hass.config_entries.async_update_entry(
                 entry,
-                title=user_input[CONF_USERNAME],
+                title=_make_entry_title(user_input[CONF_USERNAME]),
                 unique_id=unique_id,
                 data={
                     **entry.data,
@@ -139,11 +166,7 @@ class PikIntercomConfigFlow(ConfigFlow, domain=DOMAIN):
         # Create configuration entry
         username = user_input[CONF_USERNAME]
         return self.async_create_entry(
-            title=(
-                username
-                if "@" in username
-                else f"+{username[1]} ({username[2:5]}) {username[5:8]}-{username[8:10]}-{username[10:]}"
-            ),
+            title=_make_entry_title(username),
             data={
                 CONF_USERNAME: username,
                 CONF_PASSWORD: user_input[CONF_PASSWORD],
@@ -151,10 +174,7 @@ class PikIntercomConfigFlow(ConfigFlow, domain=DOMAIN):
             options={
                 CONF_DEVICE_ID: user_input[CONF_DEVICE_ID],
                 CONF_VERIFY_SSL: user_input[CONF_VERIFY_SSL],
-                **{
-                    key: value
-                    for key, (value, _) in _INTERVALS_WITH_DEFAULTS.items()
-                },
+                **_DEFAULT_INTERVAL_VALUES,
             },
         )
 
@@ -164,7 +184,7 @@ class PikIntercomConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle a flow start."""
         errors = {}
-        description_placeholders = {}
+        description_placeholders = None
 
         if user_input:
             username = None
@@ -172,7 +192,7 @@ class PikIntercomConfigFlow(ConfigFlow, domain=DOMAIN):
 
             if "@" in source_username:
                 try:
-                    username = vol.Email(source_username)
+                    username = _EMAIL_VALIDATOR(source_username)
                 except vol.Invalid:
                     errors[CONF_USERNAME] = "bad_email_format"
             else:
@@ -188,7 +208,7 @@ class PikIntercomConfigFlow(ConfigFlow, domain=DOMAIN):
                 except ConfigEntryAuthFailed as exc:
                     user_input[CONF_USERNAME] = source_username
                     errors["base"] = "authentication_error"
-                    description_placeholders["error"] = str(exc)
+                    description_placeholders = {"error": str(exc)}
 
         if entry := self._reauth_entry:
             all_data = {**entry.data, **entry.options}
@@ -202,7 +222,7 @@ class PikIntercomConfigFlow(ConfigFlow, domain=DOMAIN):
         else:
             if not user_input:
                 user_input = {
-                    CONF_DEVICE_ID: b2a_hex(urandom(15)).decode("ascii"),
+                    CONF_DEVICE_ID: urandom(15).hex(),
                 }
             schema = self.add_suggested_values_to_schema(
                 STEP_USER_DATA_SCHEMA, user_input
@@ -245,7 +265,7 @@ STEP_INIT_DATA_SCHEMA = vol.Schema(
     {
         **{
             vol.Required(key): cv.positive_time_period_dict
-            for key in _INTERVALS_WITH_DEFAULTS
+            for key in _INTERVAL_KEYS
         },
         **SHOW_INIT_OPTIONS,
         vol.Optional(
@@ -268,7 +288,7 @@ class PikIntercomOptionsFlow(OptionsFlow):
         normalized_configuration = {}
 
         if user_input:
-            for key in _INTERVALS_WITH_DEFAULTS:
+            for key in _INTERVAL_KEYS:
                 normalized_configuration[key] = user_input[key].total_seconds()
 
             normalized_configuration[CONF_ICM_SEPARATE_UPDATES] = user_input[
@@ -282,16 +302,14 @@ class PikIntercomOptionsFlow(OptionsFlow):
             ]
 
             device_id = user_input[CONF_DEVICE_ID]
-            if not re.fullmatch(r"[a-zA-Z0-9]+", device_id):
+            # Equivalent of matching against `[a-zA-Z0-9]+`
+            if not (device_id.isascii() and device_id.isalnum()):
                 errors[CONF_DEVICE_ID] = "device_id_invalid_characters"
             elif len(device_id) < MIN_DEVICE_ID_LENGTH:
                 errors[CONF_DEVICE_ID] = "device_id_too_short"
             normalized_configuration[CONF_DEVICE_ID] = device_id
 
-            for interval_key, (
-                _,
-                min_interval,
-            ) in _INTERVALS_WITH_DEFAULTS.items():
+            for interval_key, min_interval in _INTERVAL_MINIMUMS:
                 if (
                     normalized_configuration[interval_key] < min_interval
                     and normalized_configuration[interval_key] != 0
@@ -306,15 +324,28 @@ class PikIntercomOptionsFlow(OptionsFlow):
                 return self.async_create_entry(
                     title="", data=normalized_configuration
                 )
+            interval_source = normalized_configuration
         else:
-            normalized_configuration = dict(options)
+            # Only the fields shown in the form are needed for display
+            interval_source = options
+            normalized_configuration = {
+                key: options[key]
+                for key in (
+                    CONF_DEVICE_ID,
+                    CONF_VERIFY_SSL,
+                    CONF_ADD_SUGGESTED_AREAS,
+                    CONF_ICM_SEPARATE_UPDATES,
+                )
+                if key in options
+            }
 
-        for interval_key in _INTERVALS_WITH_DEFAULTS:
-            current_value = normalized_configuration[interval_key]
+        for interval_key in _INTERVAL_KEYS:
+            hours, remainder = divmod(interval_source[interval_key], 3600)
+            minutes, seconds = divmod(remainder, 60)
             normalized_configuration[interval_key] = {
-                "hours": current_value // 3600,
-                "minutes": (current_value % 3600) // 60,
-                "seconds": current_value % 60,
+                "hours": hours,
+                "minutes": minutes,
+                "seconds": seconds,
             }
 
         return self.async_show_form(
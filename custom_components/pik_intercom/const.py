@@ -4,6 +4,7 @@ DOMAIN: Final = "pik_intercom"
 
 DATA_ENTITIES: Final = DOMAIN + "_entities"
 DATA_REAUTHENTICATORS: Final = DOMAIN + "_reauthenticators"
+DATA_SNAPSHOTTERS: Final = DOMAIN + "_snapshotters"
 
 MANUFACTURER: Final = "PIK Group"
 
@@ -3,7 +3,7 @@ import logging
 import re
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from functools import partial
+from functools import cached_property, lru_cache, partial
 from typing import (
     TypeVar,
     Any,
@@ -80,12 +80,18 @@ DEVICE_MODE_TRANSLATIONS: Final = {
     "one_door": "One Door",
 }
 
+LAST_CALL_SESSION_EMPTY_TTL: Final = 60  # 1 minute
+STALE_DATA_TTL: Final = 5 * 60  # 5 minutes
+
 _T = TypeVar("_T")
 
 
 class BasePikUpdateCoordinator(DataUpdateCoordinator[_T], ABC, Generic[_T]):
     """Base class for update coordinators used by Pik Intercom integration"""
 
+    _update_task: Optional[asyncio.Task] = None
+    _last_success_at: float = 0.0
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -93,11 +99,10 @@ class BasePikUpdateCoordinator(DataUpdateCoordinator[_T], ABC, Generic[_T]):
         api_object: "PikIntercomAPI",
         update_interval: Optional[timedelta] = None,
         logger: AnyLogger = _LOGGER,
-        retries: int = 3,
+        always_update: bool = False,
     ) -> None:
         """Initialize Pik Intercom personal intercoms data updater."""
         self.api_object = api_object
-        self.update_retries = retries
 
         if isinstance(logger, logging.Logger):
             logger = ConfigEntryLoggerAdapter(logger)
@@ -108,6 +113,7 @@ class BasePikUpdateCoordinator(DataUpdateCoordinator[_T], ABC, Generic[_T]):
             logger,
             name=DOMAIN,
             update_interval=update_interval,
+            always_update=always_update,
         )
 
     def get_entities_dict(
@@ -121,18 +127,50 @@ class BasePikUpdateCoordinator(DataUpdateCoordinator[_T], ABC, Generic[_T]):
 
     async def _async_update_data(self) -> _T:
         """Fetch data."""
-        for i in range(self.update_retries):
-            try:
-                return await self._async_update_internal()
-            except asyncio.CancelledError:
-                raise
-            except BaseException as exc:
-                if (i + 1) == self.update_retries:
-                    msg = f"Unable to fetch data: {exc}"
-                    raise UpdateFailed(msg) from exc
-                # Sleep for two seconds between requests
-                self.logger.debug(f"Retrying request due to error: {exc}")
-                await asyncio.sleep(2)
+        # Concurrent refreshes share a single fetch
+        if (update_task := self._update_task) is None:
+            update_task = self.hass.async_create_task(self._async_fetch_data())
+            self._update_task = update_task
+            update_task.add_done_callback(self._clear_update_task)
+
+        # Shielded, so that cancelling one refresh does not affect others
+        return await asyncio.shield(update_task)
+
+    @callback
+    def _clear_update_task(self, _: asyncio.Task) -> None:
+        self._update_task = None
+
+    @callback
+    def async_cancel_update(self) -> None:
+        """Cancel in-flight data fetch, if any."""
+        if (update_task := self._update_task) is not None:
+            self._update_task = None
+            update_task.cancel()
+
+    async def async_shutdown(self) -> None:
+        """Cancel in-flight fetch along with scheduled refreshes."""
+        self.async_cancel_update()
+        await super().async_shutdown()
+
+    async def _async_fetch_data(self) -> _T:
+        # Failed updates are retried on the next scheduled refresh
+        try:
+            data = await self._async_update_internal()
+        except Exception as exc:
+            # Keep entities available with recent data on transient failures
+            if (
+                self.data is not None
+                and self.hass.loop.time() - self._last_success_at
+                < STALE_DATA_TTL
+            ):
+                self.logger.warning(
+                    "Unable to fetch data, keeping previous data: %s", exc
+                )
+                return self.data
+            raise UpdateFailed(f"Unable to fetch data: {exc}") from exc
+
+        self._last_success_at = self.hass.loop.time()
+        return data
 
 
 LCSCoordinatorReturnType = (
@@ -148,6 +186,8 @@ LCSCoordinatorReturnType = (
 class PikLastCallSessionUpdateCoordinator(
     BasePikUpdateCoordinator[LCSCoordinatorReturnType]
 ):
+    _empty_until: float = 0.0
+
     async def _async_update_internal(
         self,
     ) -> LCSCoordinatorReturnType:
@@ -160,38 +200,40 @@ class PikLastCallSessionUpdateCoordinator(
             return last_call_session
 
         if (data := self.data) is False:
-            return None
-
-        # @TODO: work on less frequent requests for this case
-        if data is not None:
+            # Do not query call session lists again until empty result expires
+            if self.hass.loop.time() < self._empty_until:
+                return False
+        elif data is not None:
             return data
 
-        tasks = [
-            self.hass.loop.create_task(api.iot_update_call_sessions(1)),
-            self.hass.loop.create_task(api.icm_update_call_sessions(1)),
-        ]
-
-        await asyncio.wait(tasks, return_when=asyncio.ALL_COMPLETED)
-
-        iot_result, icm_result = tasks[0].result(), tasks[1].result()
+        iot_result, icm_result = await asyncio.gather(
+            api.iot_update_call_sessions(1),
+            api.icm_update_call_sessions(1),
+            return_exceptions=True,
+        )
 
         if isinstance(iot_result, BaseException) and isinstance(
             icm_result, BaseException
         ):
             raise iot_result
         if not (last_call_session := api.get_last_call_session()):
+            self._empty_until = (
+                self.hass.loop.time() + LAST_CALL_SESSION_EMPTY_TTL
+            )
             return False
         return last_call_session
 
 
-class BasePikDictUpdateCoordinator(BasePikUpdateCoordinator[None], ABC):
+class BasePikDictUpdateCoordinator(
+    BasePikUpdateCoordinator[dict[Hashable, Any]], ABC
+):
     update_target_description: str = "<unknown>"
 
     @abstractmethod
     async def _async_update_internal_dict(self) -> Mapping[Hashable, Any]:
         raise NotImplementedError
 
-    async def _async_update_internal(self) -> None:
+    async def _async_update_internal(self) -> dict[Hashable, Any]:
         self.logger.debug(
             f"Fetching data for {self.update_target_description}"
         )
@@ -202,6 +244,12 @@ class BasePikDictUpdateCoordinator(BasePikUpdateCoordinator[None], ABC):
             f"{', '.join(map(str, dict_items))}"
         )
 
+        # Objects are updated in-place, therefore raw data received for
+        # them is used to detect changes (see `always_update`)
+        return {
+            item_id: item.source_data for item_id, item in dict_items.items()
+        }
+
 
 class BasePikIcmUpdateCoordinator(BasePikDictUpdateCoordinator, ABC):
     def __init__(
@@ -240,34 +288,92 @@ class PikIcmPropertyUpdateCoordinator(BasePikIcmUpdateCoordinator):
         return await self.api_object.icm_update_intercoms(self.object_id)
 
 
-class PikIotIntercomsUpdateCoordinator(BasePikDictUpdateCoordinator):
-    """Class to manage fetching Pik Intercom IoT data."""
-
-    update_target_description = "IoT intercoms"
-
-    async def _async_update_internal_dict(self) -> Mapping[int, IotIntercom]:
-        """Fetch data IoT intercoms data."""
-        return await self.api_object.iot_update_intercoms()
+_IOT_OBJECT_CONTAINERS: Final = {
+    IotIntercom: "iot_intercoms",
+    IotRelay: "iot_intercoms",
+    IotCamera: "iot_cameras",
+    IotMeter: "iot_meters",
+}
 
 
-class PikIotCamerasUpdateCoordinator(BasePikDictUpdateCoordinator):
+class PikIotUpdateCoordinator(
+    BasePikUpdateCoordinator[dict[str, Optional[dict[Hashable, Any]]]]
+):
     """Class to manage fetching Pik Intercom IoT data."""
 
-    update_target_description = "IoT cameras"
+    def __init__(self, *args, **kwargs) -> None:
+        # Relay identifier to the first intercom containing it
+        self.relay_intercoms: dict[int, IotIntercom] = {}
+        # Last successful fetch times per container
+        self._container_success_at: dict[str, float] = {}
+        super().__init__(*args, **kwargs)
 
-    async def _async_update_internal_dict(self) -> Mapping[int, IotCamera]:
-        """Fetch data."""
-        return await self.api_object.iot_update_cameras()
+    def has_fresh_data(self, device: BaseObject) -> bool:
+        """Check whether data for device was fetched recently enough."""
+        container_name = _IOT_OBJECT_CONTAINERS.get(type(device))
+        if container_name is None:
+            return True
+        return (self.data or {}).get(container_name) is not None
+
+    @callback
+    def _update_relay_intercoms(self) -> None:
+        relay_intercoms = {}
+        for intercom in self.api_object.iot_intercoms.values():
+            for relay_id in intercom.relay_ids:
+                relay_intercoms.setdefault(relay_id, intercom)
+        self.relay_intercoms = relay_intercoms
 
+    async def _async_update_internal(
+        self,
+    ) -> dict[str, Optional[dict[Hashable, Any]]]:
+        """Fetch IoT intercoms, cameras and meters data concurrently."""
+        self.logger.debug("Fetching data for IoT devices")
+        api = self.api_object
+        results = await asyncio.gather(
+            api.iot_update_intercoms(),
+            api.iot_update_cameras(),
+            api.iot_update_meters(),
+            return_exceptions=True,
+        )
 
-class PikIotMetersUpdateCoordinator(BasePikDictUpdateCoordinator):
-    """Class to manage fetching Pik Intercom IoT data."""
+        # Keep recent previous data for failed endpoints, so that one
+        # failure does not mark every other IoT device as changed; data
+        # older than `STALE_DATA_TTL` is dropped (devices are unavailable)
+        previous_data = self.data or {}
+        now = self.hass.loop.time()
+        data, errors = {}, []
+        for container_name, result in zip(
+            ("iot_intercoms", "iot_cameras", "iot_meters"), results
+        ):
+            if isinstance(result, Exception):
+                self.logger.warning(
+                    "Unable to fetch %s data: %s", container_name, result
+                )
+                errors.append(result)
+                success_at = self._container_success_at.get(container_name)
+                data[container_name] = (
+                    previous_data.get(container_name)
+                    if success_at is not None
+                    and now - success_at < STALE_DATA_TTL
+                    else None
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                self._container_success_at[container_name] = now
+                # Objects are updated in-place, therefore raw data received
+                # for them is used to detect changes (see `always_update`)
+                data[container_name] = {
+                    item_id: item.source_data
+                    for item_id, item in result.items()
+                }
+                if container_name == "iot_intercoms":
+                    self._update_relay_intercoms()
 
-    update_target_description = "IoT meters"
+        if len(errors) == len(results):
+            raise errors[0]
 
-    async def _async_update_internal_dict(self) -> Mapping[int, IotMeter]:
-        """Fetch data."""
-        return await self.api_object.iot_update_meters()
+        return data
 
 
 _TBasePikUpdateCoordinator = TypeVar(
@@ -278,6 +384,12 @@ _TBasePikUpdateCoordinator = TypeVar(
 _TBaseObject = TypeVar("_TBaseObject", bound=BaseObject)
 
 
+@lru_cache(maxsize=None)
+def _has_geo_unit(object_type: type) -> bool:
+    """Check whether objects of given type provide location (per type)."""
+    return hasattr(object_type, "geo_unit_short_name")
+
+
 class BasePikEntity(
     CoordinatorEntity[_TBasePikUpdateCoordinator],
     ABC,
@@ -287,6 +399,20 @@ class BasePikEntity(
 
     _attr_has_entity_name = True
 
+    # Attributes set by `_update_attr` implementations that affect state
+    _STATE_SNAPSHOT_ATTRS: ClassVar[tuple[str, ...]] = (
+        "_attr_device_class",
+        "_attr_extra_state_attributes",
+        "_attr_frontend_stream_type",
+        "_attr_icon",
+        "_attr_is_on",
+        "_attr_native_unit_of_measurement",
+        "_attr_native_value",
+    )
+
+    # Snapshot of the last state written by coordinator updates
+    _written_snapshot: Optional[tuple] = None
+
     def __init__(
         self,
         *args,
@@ -301,6 +427,8 @@ class BasePikEntity(
             self.entity_description = entity_description
         super().__init__(*args, **kwargs)
         self._update_unique_id()
+        self._entity_type = self._attr_unique_id.partition("__")[0]
+        self._update_device_info()
         self._update_attr()
 
     @callback
@@ -311,41 +439,65 @@ class BasePikEntity(
         if e := self.entity_description:
             self._attr_unique_id += "__" + e.key
 
+    @callback
+    def _update_device_info(self) -> None:
+        """Build device info, only read when entity is added."""
+        device_info = DeviceInfo(
+            name=self.common_device_name,
+            model=self.common_device_model,
+            identifiers={(DOMAIN, self.common_device_identifier)},
+            manufacturer=self.common_device_manufacturer,
+            # suggested_area=getattr(self._internal_object, "geo_unit_short_name", None),
+        )
+
+        if self.coordinator.config_entry.options.get(CONF_ADD_SUGGESTED_AREAS):
+            device_info["suggested_area"] = self.common_suggested_area
+
+        self._attr_device_info = device_info
+
     @callback
     def _update_attr(self) -> None:
         """Update the state and attributes."""
         self._attr_extra_state_attributes = {}
         if device := self._internal_object:
             self._attr_extra_state_attributes[ATTR_ID] = device.id
-            if hasattr(device, "geo_unit_short_name"):
+            if _has_geo_unit(type(device)):
                 self._attr_extra_state_attributes[
                     ATTR_LOCATION
                 ] = device.geo_unit_short_name
         else:
             self._attr_extra_state_attributes[ATTR_ID] = None
 
-        self._attr_extra_state_attributes[
-            ATTR_TYPE
-        ] = self.unique_id.partition("__")[0]
+        self._attr_extra_state_attributes[ATTR_TYPE] = self._entity_type
 
-        device_info = DeviceInfo(
-            name=self.common_device_name,
-            model=self.common_device_model,
-            identifiers={(DOMAIN, self.common_device_identifier)},
-            manufacturer=self.common_device_manufacturer,
-            # suggested_area=getattr(self._internal_object, "geo_unit_short_name", None),
+    @callback
+    def _get_state_snapshot(self) -> tuple:
+        """Collect values the written state is derived from."""
+        return (
+            self.available,
+            *(
+                getattr(self, name, None)
+                for name in self._STATE_SNAPSHOT_ATTRS
+            ),
         )
 
-        if self.coordinator.config_entry.options.get(CONF_ADD_SUGGESTED_AREAS):
-            device_info["suggested_area"] = self.common_suggested_area
-
-        self._attr_device_info = device_info
+    @callback
+    def async_write_ha_state(self) -> None:
+        # State written elsewhere may differ from the stored snapshot
+        self._written_snapshot = None
+        super().async_write_ha_state()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._update_attr()
-        self.async_write_ha_state()
+
+        # Compare against the snapshot stored with the last write made here,
+        # so that availability changes and replaced objects (e.g. new call
+        # sessions) are written, while unchanged updates are skipped
+        if (snapshot := self._get_state_snapshot()) != self._written_snapshot:
+            self.async_write_ha_state()
+            self._written_snapshot = snapshot
 
     @property
     def available(self) -> bool:
@@ -356,7 +508,7 @@ class BasePikEntity(
     def api_object(self) -> "PikIntercomAPI":
         return self.coordinator.api_object
 
-    @property
+    @cached_property
     def common_device_identifier(self) -> str:
         return self.UNIQUE_ID_FORMAT.format(self._internal_object.id)
 
@@ -421,7 +573,7 @@ class BasePikIcmIntercomEntity(
 
 
 class BasePikIotIntercomEntity(
-    BasePikEntity[PikIotIntercomsUpdateCoordinator, IotIntercom]
+    BasePikEntity[PikIotUpdateCoordinator, IotIntercom]
 ):
     UNIQUE_ID_FORMAT = "iot_intercom__{}"
 
@@ -441,19 +593,29 @@ class BasePikIotIntercomEntity(
     def common_device_name(self) -> str:
         return self.get_intercom_common_device_name(self._internal_object)
 
+    @callback
+    def _update_attr(self) -> None:
+        super()._update_attr()
+        self._attr_available = self.coordinator.has_fresh_data(
+            self._internal_object
+        )
+
     @property
     def common_device_model(self) -> str:
         return "(IoT) Intercom"
 
 
-class BasePikIotRelayEntity(
-    BasePikEntity[PikIotIntercomsUpdateCoordinator, IotRelay]
-):
+class BasePikIotRelayEntity(BasePikEntity[PikIotUpdateCoordinator, IotRelay]):
     UNIQUE_ID_FORMAT = "iot_relay__{}"
 
+    @property
+    def related_iot_intercom(self) -> Optional[IotIntercom]:
+        """First intercom containing this relay, if any."""
+        return self.coordinator.relay_intercoms.get(self._internal_object.id)
+
     @property
     def common_device_name(self) -> str:
-        if iot_intercom := self._internal_object.intercom:
+        if iot_intercom := self.related_iot_intercom:
             return BasePikIotIntercomEntity.get_intercom_common_device_name(
                 iot_intercom
             )
@@ -461,9 +623,9 @@ class BasePikIotRelayEntity(
             d := self._internal_object
         ).friendly_name or f"IoT Relay {d.id}"
 
-    @property
+    @cached_property
     def common_device_identifier(self) -> str:
-        if iot_intercom := self._internal_object.intercom:
+        if iot_intercom := self.related_iot_intercom:
             return BasePikIotIntercomEntity.UNIQUE_ID_FORMAT.format(
                 iot_intercom.id
             )
@@ -471,7 +633,7 @@ class BasePikIotRelayEntity(
 
     @property
     def common_suggested_area(self) -> Optional[str]:
-        if iot_intercom := self._internal_object.intercom:
+        if iot_intercom := self.related_iot_intercom:
             return BasePikIotIntercomEntity.get_intercom_common_suggested_area(
                 iot_intercom
             )
@@ -481,16 +643,18 @@ class BasePikIotRelayEntity(
 
     @property
     def common_device_model(self) -> str:
-        if self._internal_object.intercom:
+        if self.related_iot_intercom:
             return "(IoT) Intercom"
         return "(IoT) Relay"
 
     @callback
     def _update_attr(self) -> None:
         super()._update_attr()
+        device = self._internal_object
         self._attr_available = (
-            device := self._internal_object
-        ) in self.api_object.iot_relays.values()
+            self.coordinator.has_fresh_data(device)
+            and self.api_object.iot_relays.get(device.id) is device
+        )
         self._attr_extra_state_attributes.update(
             {
                 "original_name": device.name,
@@ -501,9 +665,7 @@ class BasePikIotRelayEntity(
         )
 
 
-class BasePikIotMeterEntity(
-    BasePikEntity[PikIotIntercomsUpdateCoordinator, IotMeter]
-):
+class BasePikIotMeterEntity(BasePikEntity[PikIotUpdateCoordinator, IotMeter]):
     UNIQUE_ID_FORMAT = "iot_meter__{}"
 
     @property
@@ -519,7 +681,7 @@ class BasePikIotMeterEntity(
         super()._update_attr()
         device = self._internal_object
         # self._attr_available = (device := self._internal_object) in self.api_object.iot_meters.values()
-        self._attr_available = True
+        self._attr_available = self.coordinator.has_fresh_data(device)
         self._attr_extra_state_attributes.update(
             {
                 ATTR_SERIAL: device.serial,
@@ -530,7 +692,7 @@ class BasePikIotMeterEntity(
 
 
 class BasePikIotCameraEntity(
-    BasePikEntity[PikIotCamerasUpdateCoordinator, IotCamera]
+    BasePikEntity[PikIotUpdateCoordinator, IotCamera]
 ):
     UNIQUE_ID_FORMAT = "iot_camera__{}"
 
@@ -546,8 +708,10 @@ class BasePikIotCameraEntity(
 
     def _update_attr(self) -> None:
         super()._update_attr()
+        device = self._internal_object
         self._attr_available = (
-            self._internal_object in self.api_object.iot_cameras.values()
+            self.coordinator.has_fresh_data(device)
+            and self.api_object.iot_cameras.get(device.id) is device
         )
 
 
@@ -562,7 +726,7 @@ class BasePikLastCallSessionEntity(
 ):
     UNIQUE_ID_FORMAT = "last_call_session__{}"
 
-    @property
+    @cached_property
     def common_device_identifier(self) -> str:
         """This sensor is tied to a config entry."""
         return BasePikLastCallSessionEntity.UNIQUE_ID_FORMAT.format(
@@ -594,55 +758,97 @@ _TUpdateCoordinator = TypeVar(
     "_TUpdateCoordinator", bound=BasePikUpdateCoordinator
 )
 EntityClassType = Type[BasePikEntity[_TUpdateCoordinator, _TBaseObject]]
-ContainerType = Mapping[Hashable, _TBaseObject]
+
+
+@callback
+def _async_forget_entity(
+    entities: dict[Hashable, Any],
+    known_item_ids: dict[Optional[str], set[Hashable]],
+    entity_key: tuple[Hashable, Optional[str]],
+    entity: "BasePikEntity",
+) -> None:
+    """Drop references to a removed entity."""
+    item_id, description_key = entity_key
+    if (item_ids := known_item_ids.get(description_key)) is not None:
+        item_ids.discard(item_id)
+    if entities.get(entity_key) is entity:
+        del entities[entity_key]
 
 
 @callback
 def async_add_entities_iteration(
     coordinator: _TUpdateCoordinator,
     async_add_entities: AddEntitiesCallback,
-    containers: ContainerType | Sequence[ContainerType],
+    container_names: str | Sequence[str],
     entity_classes: EntityClassType | Sequence[EntityClassType],
     entity_descriptions: Iterable[EntityDescription] | None = None,
     item_checker: Callable[[_TBaseObject], bool] = lambda x: True,
     *,
     logger: AnyLogger = _LOGGER,
+    entities: dict[Hashable, Any] | None = None,
+    domain: str | None = None,
+    known_item_ids: dict[Optional[str], set[Hashable]] | None = None,
 ) -> None:
     logger = get_logger(logger)
 
-    entities = coordinator.get_entities_dict(entity_classes)
-    domain = async_get_current_platform().domain
+    if entities is None:
+        entities = coordinator.get_entities_dict(entity_classes)
+    if domain is None:
+        domain = async_get_current_platform().domain
+
+    if isinstance(container_names, str):
+        container_names = (container_names,)
+
+    # Resolve containers on every call to always diff against current data
+    api_object = coordinator.api_object
+    containers = [getattr(api_object, name) for name in container_names]
 
-    if isinstance(containers, Mapping):
-        containers = (containers,)
     if isinstance(entity_classes, type):
         entity_classes = [entity_classes] * len(containers)
     elif len(entity_classes) != len(containers):
         raise ValueError("entity_classes and contains must be of same length")
 
+    # Group identifiers of already added items by entity description key
+    if known_item_ids is None:
+        known_item_ids = {}
+        for item_id, description_key in entities:
+            known_item_ids.setdefault(description_key, set()).add(item_id)
+
     new_entities = []
     for entity_class, container in zip(entity_classes, containers):
         added_device_ids = set()
         for entity_description in entity_descriptions or (None,):
-            for item_id, item in container.items():
-                if not item_checker(item):
-                    continue
-                key = (
-                    item_id,
-                    entity_description.key if entity_description else None,
-                )
-                if key in entities:
+            description_key = (
+                entity_description.key if entity_description else None
+            )
+            item_ids = known_item_ids.setdefault(description_key, set())
+
+            # Only check items that do not have entities yet
+            for item_id in container.keys() - item_ids:
+                if not item_checker(item := container[item_id]):
                     continue
 
+                item_ids.add(item_id)
                 added_device_ids.add(item_id)
-                entities[key] = entity = entity_class(
+                entity_key = (item_id, description_key)
+                entities[entity_key] = entity = entity_class(
                     coordinator,
                     device=item,
                     entity_description=entity_description,
                     logger=logger,
                 )
+                # Allow items to be re-added after their entities are removed
+                entity.async_on_remove(
+                    partial(
+                        _async_forget_entity,
+                        entities,
+                        known_item_ids,
+                        entity_key,
+                        entity,
+                    )
+                )
                 new_entities.append(entity)
-        if added_device_ids:
+        if added_device_ids and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Adding {entity_class.__name__} {domain}s for {added_device_ids}"
             )
@@ -655,24 +861,42 @@ def async_add_entities_iteration(
 def async_add_entities_with_listener(
     coordinator: BasePikUpdateCoordinator,
     async_add_entities: AddEntitiesCallback,
-    containers: ContainerType | Sequence[ContainerType],
+    container_names: str | Sequence[str],
     entity_classes: EntityClassType | Sequence[EntityClassType],
     entity_descriptions: Iterable[EntityDescription] | None = None,
     item_checker: Callable[[_TBaseObject], bool] = lambda x: True,
     *,
     logger: AnyLogger = _LOGGER,
 ) -> None:
-    add_call = partial(
-        async_add_entities_iteration,
-        coordinator,
-        async_add_entities,
-        containers,
-        entity_classes,
-        entity_descriptions,
-        item_checker,
-        logger=logger,
-    )
+    # Resolve values that do not change between calls once
+    logger = get_logger(logger)
+    entities = coordinator.get_entities_dict(entity_classes)
+    domain = async_get_current_platform().domain
+
+    # Identifiers are tracked across calls and dropped on entity removal
+    known_item_ids: dict[Optional[str], set[Hashable]] = {}
+    for item_id, description_key in entities:
+        known_item_ids.setdefault(description_key, set()).add(item_id)
+
+    # Mark listener as a callback to keep it running inside the event loop
+    @callback
+    def add_call() -> None:
+        async_add_entities_iteration(
+            coordinator,
+            async_add_entities,
+            container_names,
+            entity_classes,
+            entity_descriptions,
+            item_checker,
+            logger=logger,
+            entities=entities,
+            domain=domain,
+            known_item_ids=known_item_ids,
+        )
 
     add_call()
 
-    coordinator.async_add_listener(add_call)
+    # Listener keeps coordinator refreshing, so it must not outlive entry
+    coordinator.config_entry.async_on_unload(
+        coordinator.async_add_listener(add_call)
+    )
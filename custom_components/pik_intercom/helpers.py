@@ -95,48 +95,6 @@ def phone_validator(phone_number: str) -> str:
         )
 
 
-def patch_haffmpeg():
-    """Patch HA ffmpeg adapter to put rtsp_transport before input stream when
-    a certain non-existent command line argument (input_rtsp_transport) is provided.
-
-    """
-
-    try:
-        from haffmpeg.core import HAFFmpeg
-    except (ImportError, FileNotFoundError):
-        _LOGGER.warning(
-            "haffmpeg could not be patched because it is not yet installed"
-        )
-        return
-
-    if hasattr(HAFFmpeg, "_orig_generate_ffmpeg_cmd"):
-        return
-
-    # noinspection PyProtectedMember
-    HAFFmpeg._orig_generate_ffmpeg_cmd = HAFFmpeg._generate_ffmpeg_cmd
-
-    def _generate_ffmpeg_cmd(self, *args, **kwargs) -> None:
-        """Generate ffmpeg command line (patched to support input_rtsp_transport argument)."""
-        self._orig_generate_ffmpeg_cmd(*args, **kwargs)
-
-        _argv = self._argv
-        try:
-            rtsp_flags_index = _argv.index("-prefix_rtsp_flags")
-        except ValueError:
-            return
-        try:
-            rtsp_transport_spec = _argv[rtsp_flags_index + 1]
-        except IndexError:
-            return
-        else:
-            if not rtsp_transport_spec.startswith("-"):
-                del _argv[rtsp_flags_index : rtsp_flags_index + 2]
-                _argv.insert(1, "-rtsp_flags")
-                _argv.insert(2, rtsp_transport_spec)
-
-    HAFFmpeg._generate_ffmpeg_cmd = _generate_ffmpeg_cmd
-
-
 async def async_get_authenticated_api(
     hass: HomeAssistant,
     entry: Union[ConfigEntry, Mapping[str, Any]],
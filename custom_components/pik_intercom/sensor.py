@@ -30,7 +30,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from custom_components.pik_intercom.const import DOMAIN
 from custom_components.pik_intercom.entity import (
     BasePikIotMeterEntity,
-    PikIotMetersUpdateCoordinator,
+    PikIotUpdateCoordinator,
     BasePikLastCallSessionEntity,
     PikLastCallSessionUpdateCoordinator,
     BasePikIcmIntercomEntity,
@@ -56,15 +56,15 @@ async def async_setup_entry(
     logger = get_logger(_LOGGER)
 
     for coordinator in hass.data[DOMAIN][entry.entry_id]:
-        if isinstance(coordinator, PikIotMetersUpdateCoordinator):
-            containers = coordinator.api_object.iot_meters
+        if isinstance(coordinator, PikIotUpdateCoordinator):
+            container_names = "iot_meters"
             entity_classes = PikIotMeterSensor
             entity_descriptions = METER_ENTITY_DESCRIPTIONS
         elif isinstance(
             coordinator,
             (PikIcmPropertyUpdateCoordinator, PikIcmIntercomUpdateCoordinator),
         ):
-            containers = coordinator.api_object.icm_intercoms
+            container_names = "icm_intercoms"
             entity_classes = PikIcmIntercomSensor
             entity_descriptions = ICM_INTERCOM_ENTITY_DESCRIPTIONS
         else:
@@ -88,7 +88,7 @@ async def async_setup_entry(
         async_add_entities_with_listener(
             coordinator=coordinator,
             async_add_entities=async_add_entities,
-            containers=containers,
+            container_names=container_names,
             entity_classes=entity_classes,
             entity_descriptions=entity_descriptions,
             logger=logger,